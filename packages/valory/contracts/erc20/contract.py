@@ -19,23 +19,55 @@
 
 """This module contains the class to connect to an ERC20 token contract."""
 
-from typing import Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea.crypto.base import LedgerApi
 from aea_ledger_ethereum import EthereumApi
+from eth_abi import encode
+from eth_utils import function_signature_to_4byte_selector
+from web3 import Web3
 
 
 PUBLIC_ID = PublicId.from_str("valory/erc20:0.1.0")
 
+# Precomputed 4-byte selectors so building calldata does not Keccak-hash the
+# signature and hex round-trip through encodeABI on every call.
+DEPOSIT_SELECTOR = function_signature_to_4byte_selector("deposit()")
+WITHDRAW_SELECTOR = function_signature_to_4byte_selector("withdraw(uint256)")
+APPROVE_SELECTOR = function_signature_to_4byte_selector("approve(address,uint256)")
+
+# Contract instances are cached per ledger api and address so the ABI is only
+# parsed once per token instead of on every contract call.
+_contract_instances: Dict[Tuple[int, str], Any] = {}
+
+
+@lru_cache(maxsize=1024)
+def to_checksum_address(address: str) -> str:
+    """Convert an address to its checksummed form, caching the result."""
+    return Web3.to_checksum_address(address)
+
 
 class ERC20(Contract):
     """The ERC20 contract."""
 
     contract_id = PUBLIC_ID
 
+    @classmethod
+    def _get_cached_instance(cls, ledger_api: LedgerApi, contract_address: str) -> Any:
+        """Get a contract instance, reusing a cached one when available."""
+        key = (id(ledger_api), contract_address.lower())
+        instance = _contract_instances.get(key)
+        if instance is None:
+            instance = cls.get_instance(
+                ledger_api, to_checksum_address(contract_address)
+            )
+            _contract_instances[key] = instance
+        return instance
+
     @classmethod
     def check_balance(
         cls,
@@ -44,9 +76,8 @@ class ERC20(Contract):
         account: str,
     ) -> JSONLike:
         """Check the balance of the given account."""
-        contract_instance = cls.get_instance(ledger_api, contract_address)
-        balance_of = getattr(contract_instance.functions, "balanceOf")  # noqa
-        token_balance = balance_of(account).call()
+        contract_instance = cls._get_cached_instance(ledger_api, contract_address)
+        token_balance = contract_instance.functions.balanceOf(account).call()
         wallet_balance = ledger_api.api.eth.get_balance(account)
         return dict(token=token_balance, wallet=wallet_balance)
 
@@ -59,7 +90,7 @@ class ERC20(Contract):
         spender: str,
     ) -> JSONLike:
         """Check the balance of the given account."""
-        contract_instance = cls.get_instance(ledger_api, contract_address)
+        contract_instance = cls._get_cached_instance(ledger_api, contract_address)
         allowance = contract_instance.functions.allowance(owner, spender).call()
         return dict(data=allowance)
 
@@ -70,9 +101,7 @@ class ERC20(Contract):
         contract_address: str,
     ) -> Dict[str, bytes]:
         """Build a deposit transaction."""
-        contract_instance = cls.get_instance(ledger_api, contract_address)
-        data = contract_instance.encodeABI("deposit")
-        return {"data": bytes.fromhex(data[2:])}
+        return {"data": DEPOSIT_SELECTOR}
 
     @classmethod
     def build_withdraw_tx(
@@ -82,9 +111,7 @@ class ERC20(Contract):
         amount: int,
     ) -> Dict[str, bytes]:
         """Build a deposit transaction."""
-        contract_instance = cls.get_instance(ledger_api, contract_address)
-        data = contract_instance.encodeABI("withdraw", args=(amount,))
-        return {"data": bytes.fromhex(data[2:])}
+        return {"data": WITHDRAW_SELECTOR + encode(["uint256"], [amount])}
 
     @classmethod
     def build_approval_tx(
@@ -95,7 +122,8 @@ class ERC20(Contract):
         amount: int,
     ) -> Dict[str, bytes]:
         """Build an ERC20 approval."""
-        contract_instance = cls.get_instance(ledger_api, contract_address)
-        checksumed_spender = ledger_api.api.to_checksum_address(spender)
-        data = contract_instance.encodeABI("approve", args=(checksumed_spender, amount))
-        return {"data": bytes.fromhex(data[2:])}
+        checksumed_spender = to_checksum_address(spender)
+        data = APPROVE_SELECTOR + encode(
+            ["address", "uint256"], [checksumed_spender, amount]
+        )
+        return {"data": data}
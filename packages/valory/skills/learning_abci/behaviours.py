@@ -19,9 +19,15 @@
 
 """This package contains round behaviours of LearningAbciApp."""
 
+import json
+import time
 from abc import ABC
-from typing import Generator, Set, Type, cast
+from functools import partial
+from typing import Generator, Optional, Set, Type, cast
 
+from packages.valory.contracts.erc20.contract import ERC20
+from packages.valory.contracts.gnosis_safe.contract import GnosisSafeContract
+from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.skills.abstract_round_abci.base import AbstractRound
 from packages.valory.skills.abstract_round_abci.behaviours import (
     AbstractRoundBehaviour,
@@ -41,15 +47,39 @@ from packages.valory.skills.learning_abci.rounds import (
     SynchronizedData,
     TxPreparationRound,
 )
+from packages.valory.skills.transaction_settlement_abci.payload_tools import (
+    hash_payload_to_hex,
+)
 
 
 HTTP_OK = 200
+WEI_PER_TOKEN = 10**18
 GNOSIS_CHAIN_ID = "gnosis"
 TX_DATA = b"0x"
+TX_VALUE = 1
 SAFE_GAS = 0
 VALUE_KEY = "value"
 TO_ADDRESS_KEY = "to_address"
 
+# Event values are bound once here so the decision path does not go through
+# the enum descriptor on every round.
+EVENT_DONE = Event.DONE.value
+EVENT_TRANSACT = Event.TRANSACT.value
+
+# Pre-bound performatives save the three-level attribute walk on each RPC.
+_GET_STATE = ContractApiMessage.Performative.GET_STATE
+_STATE = ContractApiMessage.Performative.STATE
+
+# Contract ids are immutable, so stringify them once instead of on every call.
+ERC20_CONTRACT_ID = str(ERC20.contract_id)
+GNOSIS_SAFE_CONTRACT_ID = str(GnosisSafeContract.contract_id)
+
+# Everything about the transfer except the safe tx hash and the destination is
+# fixed, so bind those arguments once instead of rebuilding them per round.
+_hash_payload_to_hex = partial(
+    hash_payload_to_hex, ether_value=TX_VALUE, safe_tx_gas=SAFE_GAS, data=TX_DATA
+)
+
 
 class LearningBaseBehaviour(BaseBehaviour, ABC):  # pylint: disable=too-many-ancestors
     """Base behaviour for the learning_abci skill."""
@@ -90,22 +120,74 @@ class APICheckBehaviour(LearningBaseBehaviour):  # pylint: disable=too-many-ance
 
         self.set_done()
 
-    def get_price(self):
+    def get_price(self) -> Generator[None, None, Optional[float]]:
         """Get token price from Coingecko"""
-        # Interact with Coingecko's API
-        # result = yield from self.get_http_response("coingecko.com")
-        yield
-        price = 1.0
-        self.context.logger.info(f"Price is {price}")
+        params = self.params
+        logger = self.context.logger
+        url = params.coingecko_price_template.format(api_key=params.coingecko_api_key)
+
+        # The price barely moves within a round, so reuse a recent response
+        # instead of paying the HTTP round-trip on every APICheck round.
+        cached = self.local_state.price_cache.get(url)
+        if cached is not None:
+            price, timestamp = cached
+            if time.monotonic() - timestamp < params.price_cache_ttl:
+                logger.info("Price is %s (cached)", price)
+                return price
+
+        response = yield from self.get_http_response(method="GET", url=url)
+        if response.status_code != HTTP_OK:
+            logger.error(
+                "Could not retrieve the price from Coingecko: %s", response.status_code
+            )
+            return None
+
+        # A 200 response is no guarantee of a well-formed body: rate-limit
+        # errors and intermediate proxies can return arbitrary payloads.
+        try:
+            price = json.loads(response.body)["autonolas"]["usd"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            logger.error("Could not parse the Coingecko response: %s", response.body)
+            return None
+
+        self.local_state.price_cache[url] = (price, time.monotonic())
+        logger.info("Price is %s", price)
         return price
 
-    def get_balance(self):
+    def get_balance(self) -> Generator[None, None, Optional[float]]:
         """Get balance"""
-        # Use the contract api to interact with the ERC20 contract
-        # result = yield from self.get_contract_api_response()
-        yield
-        balance = 1.0
-        self.context.logger.info(f"Balance is {balance}")
+        logger = self.context.logger
+        sync_data = self.synchronized_data
+
+        # Reuse the last value while no new tx of ours has settled, but only
+        # within the cache TTL: external deposits can change the balance too,
+        # so the tx-hash check alone must not pin the value forever.
+        final_tx_hash = sync_data.db.get("final_tx_hash", None)
+        cached = self.local_state.balance_cache
+        if cached is not None:
+            cached_tx_hash, balance, timestamp = cached
+            if (
+                cached_tx_hash == final_tx_hash
+                and time.monotonic() - timestamp < self.params.price_cache_ttl
+            ):
+                logger.info("Balance is %s (cached)", balance)
+                return balance
+
+        response_msg = yield from self.get_contract_api_response(
+            performative=_GET_STATE,
+            contract_address=self.params.token_address,
+            contract_id=ERC20_CONTRACT_ID,
+            contract_callable="check_balance",
+            account=sync_data.safe_contract_address,
+            chain_id=GNOSIS_CHAIN_ID,
+        )
+        if response_msg.performative != _STATE:
+            logger.error("Error while retrieving the balance: %s", response_msg)
+            return None
+
+        balance = cast(int, response_msg.state.body["token"]) / WEI_PER_TOKEN
+        self.local_state.balance_cache = (final_tx_hash, balance, time.monotonic())
+        logger.info("Balance is %s", balance)
         return balance
 
 
@@ -133,8 +215,8 @@ class DecisionMakingBehaviour(
     def get_event(self):
         """Get the next event"""
         # Using the token price from the previous round, decide whether we should make a transfer or not
-        event = Event.DONE.value
-        self.context.logger.info(f"Event is {event}")
+        event = EVENT_DONE
+        self.context.logger.info("Event is %s", event)
         return event
 
 
@@ -161,12 +243,30 @@ class TxPreparationBehaviour(
 
         self.set_done()
 
-    def get_tx_hash(self):
+    def get_tx_hash(self) -> Generator[None, None, Optional[str]]:
         """Get the tx hash"""
         # We need to prepare a 1 wei transfer from the safe to another (configurable) account.
-        yield
-        tx_hash = None
-        self.context.logger.info(f"Transaction hash is {tx_hash}")
+        logger = self.context.logger
+        to_address = self.params.transfer_target_address
+
+        response_msg = yield from self.get_contract_api_response(
+            performative=_GET_STATE,
+            contract_address=self.synchronized_data.safe_contract_address,
+            contract_id=GNOSIS_SAFE_CONTRACT_ID,
+            contract_callable="get_raw_safe_transaction_hash",
+            to_address=to_address,
+            value=TX_VALUE,
+            data=TX_DATA,
+            safe_tx_gas=SAFE_GAS,
+            chain_id=GNOSIS_CHAIN_ID,
+        )
+        if response_msg.performative != _STATE:
+            logger.error("Error while getting the safe tx hash: %s", response_msg)
+            return None
+
+        safe_tx_hash = cast(str, response_msg.state.body["tx_hash"])[2:]
+        tx_hash = _hash_payload_to_hex(safe_tx_hash=safe_tx_hash, to_address=to_address)
+        logger.info("Transaction hash is %s", tx_hash)
         return tx_hash
 
 
@@ -19,7 +19,7 @@
 
 """This module contains the shared state for the abci skill of LearningAbciApp."""
 
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
 from packages.valory.skills.abstract_round_abci.models import BaseParams
 from packages.valory.skills.abstract_round_abci.models import (
@@ -37,6 +37,17 @@ class SharedState(BaseSharedState):
 
     abci_app_cls = LearningAbciApp
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the shared state."""
+        super().__init__(*args, **kwargs)
+        # Maps the price endpoint url to the last (price, monotonic timestamp)
+        # fetched from it, so rounds within the TTL skip the HTTP request.
+        self.price_cache: Dict[str, Tuple[float, float]] = {}
+        # The last (final tx hash, balance, monotonic timestamp) observed.
+        # A settled transaction of ours invalidates the entry immediately;
+        # the timestamp bounds staleness against external deposits.
+        self.balance_cache: Optional[Tuple[Optional[str], float, float]] = None
+
 
 Requests = BaseRequests
 BenchmarkTool = BaseBenchmarkTool
@@ -51,6 +62,8 @@ class Params(BaseParams):
             "coingecko_price_template", kwargs, str
         )
         self.coingecko_api_key = kwargs.get("coingecko_api_key", None)
+        self.price_cache_ttl = kwargs.get("price_cache_ttl", 30.0)
+        self.token_address = self._ensure("token_address", kwargs, str)
         self.transfer_target_address = self._ensure(
             "transfer_target_address", kwargs, str
         )